@@ -1,27 +1,47 @@
 import argparse
+import contextlib
+import copy
 import csv
+import functools
+import importlib.util
+import json
 import logging
+import multiprocessing
 import os
 import pathlib
+import queue
+import random
 import re
 import shutil
+import signal
+import sys
+import tempfile
+import threading
 import time
-from typing import Dict, Iterable, List, Optional, Tuple
-
-import yt_dlp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, TextIO, Tuple
 
 from vtt2txt import process as vtt_to_txt
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 try:
     import whisper_transcribe
 
-    _whisper_available = True
+    _whisper_available = whisper_transcribe.is_available()
 except ImportError:
     _whisper_available = False
 
+if TYPE_CHECKING:
+    import yt_dlp
+
 logger = logging.getLogger("channel_downloader")
 
-AUTO_CAPTION_ALLOWLIST = {
+AUTO_CAPTION_ALLOWLIST = frozenset({
     "en",
     "en-US",
     "en-GB",
@@ -33,10 +53,64 @@ AUTO_CAPTION_ALLOWLIST = {
     "zh-TW",
     "zh-Hans",
     "zh-Hant",
-}
+})
+
+LANGUAGE_PRIORITY = (
+    "en",
+    "en-US",
+    "en-GB",
+    "zh-Hans",
+    "zh-Hant",
+    "zh-CN",
+    "zh-TW",
+)
+_LANGUAGE_RANK = {lang: rank for rank, lang in enumerate(LANGUAGE_PRIORITY)}
+
+SUMMARY_HEADER = [
+    "video_id",
+    "title",
+    "url",
+    "upload_date",
+    "duration",
+    "subtitle_path",
+    "languages",
+    "subtitle_source",
+]
+
+# Lowercased fragments of yt-dlp error messages that no retry can fix.
+PERMANENT_ERROR_MARKERS = (
+    "video unavailable",
+    "private video",
+    "members-only",
+    "this video has been removed",
+    "not made this video available in your country",
+    "sign in to confirm your age",
+)
+
+# How long a cached channel listing is reused before it is fetched again.
+CHANNEL_CACHE_TTL_SECONDS = 3600
+
+# vtt2txt and the Whisper fallback write stripped lines plus one newline, so a
+# text file no larger than a line ending holds no subtitle text.
+_EMPTY_TEXT_SIZE = len(os.linesep)
 
 _INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]+')
 
+# Serializes summary CSV appends across worker threads.
+_summary_lock = threading.Lock()
+
+# Whisper devices not currently running a transcription; filled on first use.
+_whisper_devices: Optional["queue.Queue"] = None
+_whisper_devices_lock = threading.Lock()
+
+# Created on first use by convert_vtt_files(parallel=True); closed by vtt_pool_scope().
+_vtt_pool: Optional[ProcessPoolExecutor] = None
+_vtt_pool_lock = threading.Lock()
+
+# Last collision counter used per (directory, name) by create_unique_file.
+_unique_name_counters: Dict[Tuple[pathlib.Path, str], int] = {}
+_unique_name_lock = threading.Lock()
+
 
 def configure_logging(log_level: str = "INFO") -> None:
     level = getattr(logging, log_level.upper(), logging.INFO)
@@ -48,26 +122,173 @@ def configure_logging(log_level: str = "INFO") -> None:
     logger.setLevel(level)
 
 
+@functools.lru_cache(maxsize=4)
+def cookie_file_exists(cookie_path: pathlib.Path) -> bool:
+    """Cached existence check; the cookie file is not expected to appear or
+    disappear mid-run. Call refresh_cookie_cache() if it does."""
+    return cookie_path.exists()
+
+
+def refresh_cookie_cache() -> None:
+    cookie_file_exists.cache_clear()
+
+
 def ensure_cookiefile(opts: Dict, cookie_path: pathlib.Path) -> None:
-    if cookie_path.exists():
+    if cookie_file_exists(cookie_path):
         opts["cookiefile"] = str(cookie_path)
     elif "cookiefile" in opts:
         opts.pop("cookiefile", None)
 
 
+def metadata_options(cookie_path: pathlib.Path) -> Dict:
+    opts = {
+        "skip_download": True,
+        "quiet": True,
+        "no_warnings": True,
+    }
+    ensure_cookiefile(opts, cookie_path)
+    return opts
+
+
+def subtitle_download_options(cookie_path: pathlib.Path) -> Dict:
+    """Options for subtitle downloads; callers set subtitleslangs and the
+    subtitle output template per video."""
+    opts = {
+        "writesubtitles": True,
+        "writeautomaticsub": True,
+        "skip_download": True,
+        "noplaylist": True,
+        "ignoreerrors": True,
+        "quiet": True,
+        "no_warnings": True,
+        "outtmpl": {},
+        "overwrites": True,
+    }
+    ensure_cookiefile(opts, cookie_path)
+    return opts
+
+
+def new_youtube_dl(opts: Dict) -> "yt_dlp.YoutubeDL":
+    # Imported on first use: loading yt-dlp's extractors is the slowest part of
+    # startup, and --help or spawned VTT workers never need them.
+    import yt_dlp
+
+    return yt_dlp.YoutubeDL(opts)
+
+
+def open_youtube_dl(shared: Optional["yt_dlp.YoutubeDL"], opts: Dict):
+    """Context manager yielding shared if given, else a fresh YoutubeDL(opts)."""
+    if shared is not None:
+        return contextlib.nullcontext(shared)
+    return new_youtube_dl(opts)
+
+
+class ThreadLocalYoutubeDL:
+    """Hand out one YoutubeDL per thread, built from a fixed set of options.
+
+    Building a YoutubeDL loads extractors and cookies, so channel runs keep one
+    per worker thread instead of one per video. Instances are not shared
+    between threads because callers adjust params per video.
+    """
+
+    def __init__(self, opts: Dict) -> None:
+        self._opts = opts
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances: List["yt_dlp.YoutubeDL"] = []
+
+    def __enter__(self) -> "ThreadLocalYoutubeDL":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with self._lock:
+            for ydl in self._instances:
+                ydl.close()
+            self._instances.clear()
+
+    def get(self) -> "yt_dlp.YoutubeDL":
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            # YoutubeDL keeps a reference to the dict it is given.
+            ydl = new_youtube_dl(copy.deepcopy(self._opts))
+            self._local.ydl = ydl
+            with self._lock:
+                self._instances.append(ydl)
+        return ydl
+
+
+def load_cached_entries(
+    cache_path: pathlib.Path,
+    channel_url: str,
+    limit: Optional[int],
+    ttl_seconds: float,
+) -> Optional[List[Dict]]:
+    """Return the cached channel listing if it is fresh and covers limit."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl_seconds:
+            return None
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if data.get("channel_url") != channel_url:
+        return None
+    # A listing fetched with a smaller limit cannot answer a larger request.
+    cached_limit = data.get("limit")
+    if cached_limit and (not limit or limit > cached_limit):
+        return None
+    entries = data.get("entries") or []
+    return entries[:limit] if limit else entries
+
+
+def save_cached_entries(
+    cache_path: pathlib.Path,
+    channel_url: str,
+    limit: Optional[int],
+    entries: List[Dict],
+) -> None:
+    payload = {"channel_url": channel_url, "limit": limit, "entries": entries}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:  # pragma: no cover - filesystem variance
+        logger.warning("Unable to write channel cache %s: %s", cache_path, exc)
+
+
 def get_channel_video_entries(
-    channel_url: str, *, cookie_path: pathlib.Path
+    channel_url: str,
+    *,
+    cookie_path: pathlib.Path,
+    limit: Optional[int] = None,
+    cache_path: Optional[pathlib.Path] = None,
+    refresh: bool = False,
+    cache_ttl: float = CHANNEL_CACHE_TTL_SECONDS,
 ) -> Optional[List[Dict]]:
-    """Return basic metadata for every video listed on the channel."""
+    """Return basic metadata for the videos listed on the channel.
+
+    When limit is given, yt-dlp stops paginating after that many entries.
+    When cache_path is given, a listing saved there within cache_ttl seconds
+    is reused unless refresh is set.
+    """
+    if cache_path and not refresh:
+        cached = load_cached_entries(cache_path, channel_url, limit, cache_ttl)
+        if cached is not None:
+            logger.info("Using cached channel listing from %s", cache_path)
+            return cached
+
     ydl_opts = {
-        "extract_flat": True,
+        "extract_flat": "in_playlist",
         "quiet": True,
         "no_warnings": True,
     }
+    if limit:
+        ydl_opts["playlistend"] = limit
     ensure_cookiefile(ydl_opts, cookie_path)
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with new_youtube_dl(ydl_opts) as ydl:
             result = ydl.extract_info(channel_url, download=False)
     except Exception as exc:  # pragma: no cover - network failure path
         logger.error("Failed to fetch channel listing: %s", exc)
@@ -79,7 +300,7 @@ def get_channel_video_entries(
         if not url:
             continue
         if not url.startswith("http"):
-            url = f"https://www.youtube.com/watch?v={url}"
+            url = f"https://www.youtube.com/watch?v={entry.get('id') or url}"
         entries.append(
             {
                 "id": entry.get("id"),
@@ -87,21 +308,44 @@ def get_channel_video_entries(
                 "url": url,
             }
         )
+    if cache_path:
+        save_cached_entries(cache_path, channel_url, limit, entries)
     return entries
 
 
-def retry(operation, *, max_attempts: int = 3, delay_seconds: float = 5.0):
+def is_permanent_error(exc: Exception) -> bool:
+    """True for yt-dlp failures that will not go away on retry."""
+    if isinstance(exc, ImportError):
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in PERMANENT_ERROR_MARKERS)
+
+
+def retry(
+    operation,
+    *,
+    max_attempts: int = 3,
+    delay_seconds: float = 5.0,
+    max_delay_seconds: float = 60.0,
+    retryable_errors: Tuple[type, ...] = (Exception,),
+):
     last_error = None
     for attempt in range(1, max_attempts + 1):
         try:
             return operation()
-        except Exception as exc:  # pragma: no cover - runtime resilience
+        except retryable_errors as exc:  # pragma: no cover - runtime resilience
             last_error = exc
+            if is_permanent_error(exc):
+                logger.warning("Not retrying permanent error: %s", exc)
+                raise
             logger.warning(
                 "Attempt %s/%s failed with error: %s", attempt, max_attempts, exc
             )
             if attempt < max_attempts:
-                sleep_time = delay_seconds * attempt
+                # Capped exponential backoff with jitter, so workers that failed
+                # together (e.g. on a 429) do not all retry at the same moment.
+                sleep_time = min(max_delay_seconds, delay_seconds * 2 ** (attempt - 1))
+                sleep_time *= random.uniform(0.5, 1.0)
                 logger.info("Retrying in %.1f seconds...", sleep_time)
                 time.sleep(sleep_time)
     raise last_error  # noqa: RAS003
@@ -116,49 +360,78 @@ def format_upload_date(raw: Optional[str]) -> str:
 
 
 def collect_language_order(langs: Iterable[str]) -> List[str]:
-    priority = [
-        "en",
-        "en-US",
-        "en-GB",
-        "zh-Hans",
-        "zh-Hant",
-        "zh-CN",
-        "zh-TW",
-    ]
-    ordered = []
-    for fav in priority:
-        for lang in langs:
-            if lang == fav and lang not in ordered:
-                ordered.append(lang)
-    for lang in langs:
-        if lang not in ordered:
-            ordered.append(lang)
-    return ordered
+    # Stable sort: languages outside the priority list keep their input order.
+    return sorted(
+        dict.fromkeys(langs),
+        key=lambda lang: _LANGUAGE_RANK.get(lang, len(LANGUAGE_PRIORITY)),
+    )
+
+
+@contextlib.contextmanager
+def exclusive_file_lock(fh):
+    """Hold an advisory lock on fh so separate runs appending to the same
+    summary cannot interleave rows. No-op where fcntl is unavailable."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _write_header_if_empty(csvfile, writer) -> None:
+    # Checked under the file lock; another process may have written it.
+    csvfile.seek(0, os.SEEK_END)
+    if csvfile.tell() == 0:
+        writer.writerow(SUMMARY_HEADER)
 
 
 def write_summary_row(summary_path: pathlib.Path, row: List[str]) -> None:
-    write_header = not summary_path.exists()
-    with summary_path.open("a", encoding="utf-8", newline="") as csvfile:
+    with _summary_lock, summary_path.open(
+        "a", encoding="utf-8", newline=""
+    ) as csvfile, exclusive_file_lock(csvfile):
         writer = csv.writer(csvfile)
-        if write_header:
-            writer.writerow(
-                [
-                    "video_id",
-                    "title",
-                    "url",
-                    "upload_date",
-                    "duration",
-                    "subtitle_path",
-                    "languages",
-                    "subtitle_source",
-                ]
-            )
+        _write_header_if_empty(csvfile, writer)
         writer.writerow(row)
+        csvfile.flush()
+
+
+class SummaryWriter:
+    """Append rows to the summary CSV through a single open file handle.
+
+    Used for channel runs so each video does not reopen the file. Rows are
+    flushed as they are written so an interrupted run keeps its progress.
+    """
+
+    def __init__(self, summary_path: pathlib.Path) -> None:
+        self.summary_path = summary_path
+        self._lock = threading.Lock()
+        self._csvfile = None
+        self._writer = None
+
+    def __enter__(self) -> "SummaryWriter":
+        self._csvfile = self.summary_path.open("a", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._csvfile)
+        with exclusive_file_lock(self._csvfile):
+            _write_header_if_empty(self._csvfile, self._writer)
+            self._csvfile.flush()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._csvfile.close()
+
+    def write_row(self, row: List[str]) -> None:
+        with self._lock, exclusive_file_lock(self._csvfile):
+            self._writer.writerow(row)
+            self._csvfile.flush()
 
 
 def sanitize_filename(value: str) -> str:
     cleaned = _INVALID_FILENAME_CHARS.sub("_", value)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    # split() with no argument collapses whitespace runs and trims both ends.
+    cleaned = " ".join(cleaned.split())
     if not cleaned:
         return "output"
     # Avoid trailing periods/spaces that some file systems dislike.
@@ -166,6 +439,35 @@ def sanitize_filename(value: str) -> str:
     return cleaned[:200]
 
 
+def create_unique_file(
+    directory: pathlib.Path, stem: str, suffix: str
+) -> Tuple[pathlib.Path, int]:
+    """Create ``<stem><suffix>`` in directory, appending " (n)" on collisions.
+
+    Each candidate is claimed with O_CREAT | O_EXCL, so the existence check and
+    the creation are one syscall and parallel workers never share a name.
+    The last counter used for a name is remembered, so a run with many
+    identically titled videos does not re-probe every earlier candidate.
+    Returns the path and an open file descriptor for writing.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    key = (directory, f"{stem}{suffix}")
+    with _unique_name_lock:
+        counter = _unique_name_counters.get(key, 0)
+    while True:
+        name = f"{stem} ({counter}){suffix}" if counter else f"{stem}{suffix}"
+        path = directory / name
+        try:
+            fd = os.open(path, flags, 0o644)
+        except FileExistsError:
+            counter += 1
+            continue
+        with _unique_name_lock:
+            if counter > _unique_name_counters.get(key, -1):
+                _unique_name_counters[key] = counter
+        return path, fd
+
+
 def normalize_channel_name(name: str) -> str:
     slug = name.strip()
     if not slug:
@@ -212,7 +514,7 @@ def download_audio(
 
     try:
         def _download():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with new_youtube_dl(ydl_opts) as ydl:
                 ydl.download([video_url])
 
         retry(_download)
@@ -227,93 +529,193 @@ def download_audio(
     return None
 
 
-def determine_languages(info: Dict) -> List[str]:
-    languages = set()
-    for lang in (info.get("subtitles") or {}).keys():
-        languages.add(lang)
-    for lang in (info.get("automatic_captions") or {}).keys():
-        if lang in AUTO_CAPTION_ALLOWLIST:
-            languages.add(lang)
+def determine_languages(info: Dict, max_languages: int = 1) -> List[str]:
+    subtitles = info.get("subtitles") or {}
+    auto_captions = {
+        lang for lang in (info.get("automatic_captions") or {})
+        if lang in AUTO_CAPTION_ALLOWLIST
+    }
+
+    # Priority languages first; usually the first hit is all we need.
+    selected = []
+    for lang in LANGUAGE_PRIORITY:
+        if lang in subtitles or lang in auto_captions:
+            selected.append(lang)
+            if len(selected) == max_languages:
+                return selected
+
+    others = sorted(auto_captions.union(subtitles).difference(LANGUAGE_PRIORITY))
+    selected.extend(others[: max_languages - len(selected)])
+    if selected:
+        return selected
+    return [info.get("language") or "en"]
+
+
+def _get_vtt_pool() -> ProcessPoolExecutor:
+    global _vtt_pool
+    with _vtt_pool_lock:
+        if _vtt_pool is None:
+            _vtt_pool = ProcessPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2),
+                # Download threads may be running; do not fork under them.
+                mp_context=multiprocessing.get_context("spawn"),
+                # Ctrl-C is handled by the main process, which shuts the pool down.
+                initializer=signal.signal,
+                initargs=(signal.SIGINT, signal.SIG_IGN),
+            )
+        return _vtt_pool
 
-    if not languages:
-        fallback = info.get("language")
-        if fallback:
-            languages.add(fallback)
-        else:
-            languages.add("en")
 
-    ordered = collect_language_order(sorted(languages))
-    return ordered[:1]
+def _discard_vtt_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next conversion starts a fresh one."""
+    global _vtt_pool
+    with _vtt_pool_lock:
+        if _vtt_pool is pool:
+            _vtt_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@contextlib.contextmanager
+def vtt_pool_scope():
+    """Shut down the VTT pool, if one was started, when the block exits."""
+    global _vtt_pool
+    try:
+        yield
+    finally:
+        with _vtt_pool_lock:
+            pool, _vtt_pool = _vtt_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def convert_vtt_files(
+    vtt_files: List[pathlib.Path], *, parallel: bool = False
+) -> List[pathlib.Path]:
+    """Convert VTT files to .txt next to them and return those that succeeded.
+
+    With parallel=True the CPU-bound parsing runs in a shared process pool so
+    it does not hold the GIL while download threads are busy.
+    """
+    if parallel:
+        pool = _get_vtt_pool()
+        try:
+            jobs = [pool.submit(vtt_to_txt, vtt_file).result for vtt_file in vtt_files]
+        except BrokenProcessPool:
+            _discard_vtt_pool(pool)
+            parallel = False
+    if not parallel:
+        jobs = [functools.partial(vtt_to_txt, vtt_file) for vtt_file in vtt_files]
+
+    converted = []
+    for vtt_file, job in zip(vtt_files, jobs):
+        try:
+            try:
+                job()
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM kill); later videos get a new pool
+                # and this file is converted here instead.
+                _discard_vtt_pool(pool)
+                vtt_to_txt(vtt_file)
+        except Exception as exc:
+            logger.warning("Failed to convert %s: %s", vtt_file, exc)
+            continue
+        converted.append(vtt_file)
+    return converted
+
+
+def scan_subtitle_files(
+    video_dir: pathlib.Path,
+) -> Tuple[List[pathlib.Path], List[pathlib.Path]]:
+    """Return the sorted .vtt and Whisper .txt files in video_dir.
+
+    One scandir pass with plain name checks, instead of a Path.glob per
+    pattern.
+    """
+    vtt_files = []
+    whisper_files = []
+    with os.scandir(video_dir) as it:
+        for dir_entry in it:
+            name = dir_entry.name
+            if name.endswith(".vtt"):
+                vtt_files.append(pathlib.Path(dir_entry.path))
+            elif name.endswith(".txt") and ".whisper-" in name:
+                whisper_files.append(pathlib.Path(dir_entry.path))
+    vtt_files.sort()
+    whisper_files.sort()
+    return vtt_files, whisper_files
 
 
 def gather_subtitle_sections(
-    video_dir: pathlib.Path, video_url: str
-) -> Tuple[List[Tuple[str, str]], List[str]]:
-    vtt_files = sorted(video_dir.glob("*.vtt"))
-    whisper_files = sorted(video_dir.glob("*.whisper-*.txt"))
+    video_dir: pathlib.Path,
+    video_url: str,
+    *,
+    parallel_conversion: bool = False,
+    subtitle_files: Optional[Tuple[List[pathlib.Path], List[pathlib.Path]]] = None,
+) -> Tuple[List[Tuple[str, pathlib.Path]], List[str]]:
+    """Convert the subtitle files in video_dir and pick one text file per language.
+
+    subtitle_files is a scan_subtitle_files() result the caller already has;
+    the directory is scanned when it is omitted. Returns (language, text_path)
+    pairs in priority order, plus the languages. The text is left on disk for
+    write_subtitle to stream.
+    """
+    vtt_files, whisper_files = subtitle_files or scan_subtitle_files(video_dir)
 
     if not vtt_files and not whisper_files:
         logger.warning("No subtitle files were downloaded for %s", video_url)
         return [], []
 
-    language_to_content: Dict[str, str] = {}
+    language_to_path: Dict[str, pathlib.Path] = {}
 
     # Process VTT files
-    for vtt_file in vtt_files:
-        parts = vtt_file.stem.split(".")
-        lang = parts[-1] if len(parts) > 1 else "unknown"
-        try:
-            vtt_to_txt(vtt_file)
-        except Exception as exc:
-            logger.warning("Failed to convert %s: %s", vtt_file, exc)
-            continue
+    for vtt_file in convert_vtt_files(vtt_files, parallel=parallel_conversion):
+        _, dot, lang = vtt_file.stem.rpartition(".")
+        if not dot:
+            lang = "unknown"
         txt_path = vtt_file.with_suffix(".txt")
-        if not txt_path.exists():
+        try:
+            size = txt_path.stat().st_size
+        except FileNotFoundError:
             logger.warning("Missing converted text for %s", vtt_file)
             continue
-        text_content = txt_path.read_text(encoding="utf-8").strip()
-        if text_content:
-            language_to_content[lang] = text_content
+        if size > _EMPTY_TEXT_SIZE:
+            language_to_path[lang] = txt_path
 
     # Process Whisper files (only if VTT didn't provide that language)
     for whisper_file in whisper_files:
-        match = re.search(r"\.whisper-(.+)$", whisper_file.stem)
-        if not match:
+        _, marker, lang = whisper_file.stem.rpartition(".whisper-")
+        if not marker or not lang:
             continue
-        lang = match.group(1)
-        if lang in language_to_content:
+        if lang in language_to_path:
             continue
-        text_content = whisper_file.read_text(encoding="utf-8").strip()
-        if text_content:
-            language_to_content[lang] = text_content
+        if whisper_file.stat().st_size > _EMPTY_TEXT_SIZE:
+            language_to_path[lang] = whisper_file
 
-    if not language_to_content:
+    if not language_to_path:
         logger.warning("All subtitles empty or unavailable for %s", video_url)
         return [], []
 
-    ordered = collect_language_order(language_to_content.keys())
-    subtitle_sections = [(lang, language_to_content[lang]) for lang in ordered]
-    unique_languages = list(dict.fromkeys(ordered))
-    return subtitle_sections, unique_languages
+    ordered = collect_language_order(language_to_path.keys())
+    subtitle_sections = [(lang, language_to_path[lang]) for lang in ordered]
+    return subtitle_sections, ordered
 
 
-def compose_subtitle_lines(
-    info: Dict, subtitle_sections: List[Tuple[str, str]], video_url: str
-) -> List[str]:
-    header = [
-        f"Title: {info.get('title') or 'Unknown'}",
-        f"URL: {info.get('webpage_url') or video_url}",
-        f"Upload Date: {format_upload_date(info.get('upload_date'))}",
-    ]
+def write_subtitle(
+    out: TextIO,
+    info: Dict,
+    subtitle_sections: List[Tuple[str, pathlib.Path]],
+    video_url: str,
+) -> None:
+    """Write the header, then copy each section's text file into out."""
+    out.write(f"Title: {info.get('title') or 'Unknown'}\n")
+    out.write(f"URL: {info.get('webpage_url') or video_url}\n")
+    out.write(f"Upload Date: {format_upload_date(info.get('upload_date'))}\n")
     if info.get("channel"):
-        header.append(f"Channel: {info['channel']}")
-
-    lines = header + [""]
-    for lang, text_content in subtitle_sections:
-        lines.append(f"--- Subtitle ({lang}) ---")
-        lines.append(text_content)
-        lines.append("")
-    return lines
+        out.write(f"Channel: {info['channel']}\n")
+    for lang, text_path in subtitle_sections:
+        out.write(f"\n--- Subtitle ({lang}) ---\n")
+        with text_path.open("r", encoding="utf-8") as src:
+            shutil.copyfileobj(src, out)
 
 
 def build_subtitle(
@@ -321,8 +723,16 @@ def build_subtitle(
     video_dir: pathlib.Path,
     final_dir: pathlib.Path,
     video_url: str,
+    *,
+    parallel_conversion: bool = False,
+    subtitle_files: Optional[Tuple[List[pathlib.Path], List[pathlib.Path]]] = None,
 ) -> Tuple[Optional[pathlib.Path], List[str]]:
-    subtitle_sections, languages = gather_subtitle_sections(video_dir, video_url)
+    subtitle_sections, languages = gather_subtitle_sections(
+        video_dir,
+        video_url,
+        parallel_conversion=parallel_conversion,
+        subtitle_files=subtitle_files,
+    )
     if not subtitle_sections:
         return None, []
 
@@ -330,106 +740,138 @@ def build_subtitle(
     author = info.get("channel") or info.get("uploader") or "Unknown"
     title = info.get("title") or "Unknown Title"
     filename = sanitize_filename(f"YouTube - {author} - {title}") or "YouTube-Unknown"
-    final_path = final_dir / f"{filename}.txt"
-    counter = 1
-    while final_path.exists():
-        final_path = final_dir / f"{filename} ({counter}).txt"
-        counter += 1
-
-    lines = compose_subtitle_lines(info, subtitle_sections, video_url)
-    final_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    final_path, fd = create_unique_file(final_dir, filename, ".txt")
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            write_subtitle(fh, info, subtitle_sections, video_url)
+    except BaseException:
+        # A truncated file would sit next to the retry's "(1)" copy forever.
+        final_path.unlink(missing_ok=True)
+        raise
     logger.info("Subtitle saved to %s", final_path)
     return final_path, languages
 
 
-def process_single_video(
+def fetch_video_subtitles(
     entry: Dict,
-    output_dir: pathlib.Path,
-    summary_path: pathlib.Path,
+    video_dir: pathlib.Path,
     *,
     cookie_path: pathlib.Path,
-    print_output: bool = False,
-    whisper_model: Optional[str] = None,
-) -> None:
+    max_languages: int = 1,
+    metadata_ydl: Optional["yt_dlp.YoutubeDL"] = None,
+    download_ydl: Optional["yt_dlp.YoutubeDL"] = None,
+    info: Optional[Dict] = None,
+) -> Tuple[Dict, List[str], str]:
+    """Fetch metadata and download subtitle files (network stage).
+
+    Subtitle files are written into video_dir. metadata_ydl and download_ydl
+    may be long-lived instances built from metadata_options() and
+    subtitle_download_options(); otherwise fresh ones are created. An info
+    dict the caller already extracted skips the metadata request.
+    Returns (info, downloaded_languages, subtitle_source).
+    """
     video_url = entry["url"]
-    logger.info("Processing video: %s", video_url)
-
-    template = str(output_dir / "%(id)s" / "%(id)s.%(language)s.%(ext)s")
+    template = str(video_dir / "%(id)s.%(language)s.%(ext)s")
 
     def _operation() -> Tuple[Dict, List[str], str]:
-        metadata_opts = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-        }
-        ensure_cookiefile(metadata_opts, cookie_path)
-
-        with yt_dlp.YoutubeDL(metadata_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
+        nonlocal info
+        if info is None:
+            with open_youtube_dl(metadata_ydl, metadata_options(cookie_path)) as ydl:
+                info = ydl.extract_info(video_url, download=False)
 
-        languages = determine_languages(info)
+        languages = determine_languages(info, max_languages)
         logger.debug("Languages selected for %s: %s", video_url, ",".join(languages))
 
-        base_download_opts = {
-            "writesubtitles": True,
-            "writeautomaticsub": True,
-            "skip_download": True,
-            "noplaylist": True,
-            "ignoreerrors": True,
-            "quiet": True,
-            "no_warnings": True,
-            "outtmpl": {"subtitle": template},
-            "overwrites": True,
-        }
-
-        ensure_cookiefile(base_download_opts, cookie_path)
+        has_subtitles = bool(info.get("subtitles")) or any(
+            lang in AUTO_CAPTION_ALLOWLIST
+            for lang in (info.get("automatic_captions") or {})
+        )
+        if not has_subtitles:
+            # Nothing yt-dlp could fetch; skip the download round trip.
+            logger.info("No subtitles available for %s; skipping download", video_url)
+            return info, [], "none"
 
-        video_id_local = info.get("id")
-        if video_id_local:
-            target_dir = output_dir / video_id_local
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            target_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            # All languages go through one YoutubeDL and reuse the info extracted
+            # above, so yt-dlp does not fetch the video page a second time.
+            with open_youtube_dl(
+                download_ydl, subtitle_download_options(cookie_path)
+            ) as ydl:
+                ydl.params["subtitleslangs"] = languages
+                ydl.params["outtmpl"]["subtitle"] = template
+                ydl.process_ie_result(info, download=True)
+            downloaded_languages = list(languages)
+        except Exception as exc:  # pragma: no cover - network resilience
+            logger.warning(
+                "Unable to download subtitles for %s (%s): %s",
+                ",".join(languages),
+                video_url,
+                exc,
+            )
+            downloaded_languages = []
 
-        downloaded_languages: List[str] = []
         subtitle_source = "none"
-        for lang in languages:
-            lang_opts = dict(base_download_opts)
-            lang_opts["subtitleslangs"] = [lang]
-            try:
-                with yt_dlp.YoutubeDL(lang_opts) as ydl:
-                    ydl.download([video_url])
-                downloaded_languages.append(lang)
-                if lang in info.get("subtitles", {}):
-                    logger.debug("Downloaded subtitle (%s) for %s", lang, video_url)
-                    subtitle_source = "manual"
-                else:
-                    logger.debug("Downloaded auto-caption (%s) for %s", lang, video_url)
-                    if subtitle_source != "manual":
-                        subtitle_source = "auto-caption"
-            except Exception as exc:  # pragma: no cover - network resilience
-                logger.warning(
-                    "Unable to download subtitles for %s (%s): %s", lang, video_url, exc
-                )
-                time.sleep(1.5)
-                continue
-            time.sleep(0.5)
+        for lang in downloaded_languages:
+            if lang in info.get("subtitles", {}):
+                logger.debug("Downloaded subtitle (%s) for %s", lang, video_url)
+                subtitle_source = "manual"
+            else:
+                logger.debug("Downloaded auto-caption (%s) for %s", lang, video_url)
+                if subtitle_source != "manual":
+                    subtitle_source = "auto-caption"
 
         if not downloaded_languages:
             logger.warning("No subtitles were downloaded for %s", video_url)
 
         return info, downloaded_languages, subtitle_source
 
-    info, requested_languages, subtitle_source = retry(_operation)
+    return retry(_operation)
+
+
+@contextlib.contextmanager
+def whisper_device():
+    """Check out a Whisper device for one transcription.
+
+    Each visible GPU runs one transcription at a time, so worker threads
+    spread across GPUs; without CUDA there is a single slot, as before.
+    """
+    global _whisper_devices
+    with _whisper_devices_lock:
+        if _whisper_devices is None:
+            _whisper_devices = queue.Queue()
+            for device in whisper_transcribe.available_devices():
+                _whisper_devices.put(device)
+    device = _whisper_devices.get()
+    try:
+        yield device
+    finally:
+        _whisper_devices.put(device)
+
 
+def finalize_video(
+    entry: Dict,
+    info: Dict,
+    requested_languages: List[str],
+    subtitle_source: str,
+    video_dir: pathlib.Path,
+    output_dir: pathlib.Path,
+    summary_path: pathlib.Path,
+    *,
+    cookie_path: pathlib.Path,
+    print_output: bool = False,
+    whisper_model: Optional[str] = None,
+    summary_writer: Optional[SummaryWriter] = None,
+    parallel_conversion: bool = False,
+) -> None:
+    """Convert the files in video_dir and write the outputs (local stage)."""
+    video_url = entry["url"]
     video_id = info.get("id") or entry.get("id") or "unknown"
-    video_dir = output_dir / video_id
-    if not video_dir.exists():
-        logger.warning("Expected download directory %s missing; creating manually", video_dir)
-        video_dir.mkdir(parents=True, exist_ok=True)
+    # Scanned once; the Whisper fallback appends the file it writes.
+    vtt_files, whisper_files = scan_subtitle_files(video_dir)
 
     # Whisper fallback: if no VTT files were downloaded, try transcription
-    if not list(video_dir.glob("*.vtt")) and whisper_model:
+    if whisper_model and not vtt_files:
         if _whisper_available:
             logger.info("No subtitles found; attempting Whisper transcription for %s", video_url)
             audio_path = download_audio(
@@ -437,12 +879,14 @@ def process_single_video(
             )
             if audio_path:
                 try:
-                    text, detected_lang = whisper_transcribe.transcribe(
-                        audio_path, whisper_model
-                    )
+                    with whisper_device() as device:
+                        text, detected_lang = whisper_transcribe.transcribe(
+                            audio_path, whisper_model, device
+                        )
                     if text:
                         whisper_file = video_dir / f"{video_id}.whisper-{detected_lang}.txt"
                         whisper_file.write_text(text + "\n", encoding="utf-8")
+                        whisper_files.append(whisper_file)
                         subtitle_source = "whisper"
                         logger.info(
                             "Whisper transcription saved (%s) for %s",
@@ -456,66 +900,109 @@ def process_single_video(
         else:
             logger.warning(
                 "Whisper not installed; skipping transcription fallback for %s. "
-                "Install with: pip install openai-whisper",
+                "Install with: pip install openai-whisper (or faster-whisper)",
                 video_url,
             )
 
     # Handle print-to-stdout mode
     if print_output:
-        subtitle_sections, _ = gather_subtitle_sections(video_dir, video_url)
+        subtitle_sections, _ = gather_subtitle_sections(
+            video_dir, video_url, subtitle_files=(vtt_files, whisper_files)
+        )
         if subtitle_sections:
-            lines = compose_subtitle_lines(info, subtitle_sections, video_url)
-            print("\n".join(lines).rstrip())
-
-        cleanup_intermediate_dir(video_dir)
+            write_subtitle(sys.stdout, info, subtitle_sections, video_url)
         return
 
     # Normal file-saving mode
     final_dir = output_dir / "final"
-    subtitle_path, languages = build_subtitle(info, video_dir, final_dir, video_url)
+    subtitle_path, languages = build_subtitle(
+        info,
+        video_dir,
+        final_dir,
+        video_url,
+        parallel_conversion=parallel_conversion,
+        subtitle_files=(vtt_files, whisper_files),
+    )
 
     if subtitle_path:
         language_list = languages or requested_languages or sorted(
-            {path.stem.split(".")[-1] for path in video_dir.glob("*.vtt")}
+            {path.stem.rpartition(".")[2] for path in vtt_files}
         )
         duration = info.get("duration")
-        write_summary_row(
-            summary_path,
-            [
-                video_id,
-                info.get("title") or entry.get("title") or "",
-                info.get("webpage_url") or video_url,
-                format_upload_date(info.get("upload_date")),
-                str(int(duration)) if duration else "",
-                str(subtitle_path.relative_to(output_dir)),
-                ",".join(language_list),
-                subtitle_source,
-            ],
-        )
+        row = [
+            video_id,
+            info.get("title") or entry.get("title") or "",
+            info.get("webpage_url") or video_url,
+            format_upload_date(info.get("upload_date")),
+            str(int(duration)) if duration else "",
+            str(subtitle_path.relative_to(output_dir)),
+            ",".join(language_list),
+            subtitle_source,
+        ]
+        if summary_writer:
+            summary_writer.write_row(row)
+        else:
+            write_summary_row(summary_path, row)
     else:
         logger.warning("Skipping summary entry for %s due to missing subtitle", video_url)
 
-    cleanup_intermediate_dir(video_dir)
 
-
-def get_channel_from_video(video_url: str, *, cookie_path: pathlib.Path) -> Optional[str]:
-    """Extract channel name from a video URL."""
+def process_single_video(
+    entry: Dict,
+    output_dir: pathlib.Path,
+    summary_path: pathlib.Path,
+    *,
+    cookie_path: pathlib.Path,
+    print_output: bool = False,
+    whisper_model: Optional[str] = None,
+    summary_writer: Optional[SummaryWriter] = None,
+    max_languages: int = 1,
+    parallel_conversion: bool = False,
+    metadata_ydl: Optional["yt_dlp.YoutubeDL"] = None,
+    download_ydl: Optional["yt_dlp.YoutubeDL"] = None,
+    info: Optional[Dict] = None,
+) -> None:
+    logger.info("Processing video: %s", entry["url"])
+    # A fresh private directory per call, so parallel workers (or a retry of
+    # the same video) never share intermediate files.
+    video_dir = pathlib.Path(
+        tempfile.mkdtemp(dir=output_dir, prefix=f"{entry.get('id') or 'video'}-")
+    )
     try:
-        metadata_opts = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-        }
-        ensure_cookiefile(metadata_opts, cookie_path)
+        info, requested_languages, subtitle_source = fetch_video_subtitles(
+            entry,
+            video_dir,
+            cookie_path=cookie_path,
+            max_languages=max_languages,
+            metadata_ydl=metadata_ydl,
+            download_ydl=download_ydl,
+            info=info,
+        )
+        finalize_video(
+            entry,
+            info,
+            requested_languages,
+            subtitle_source,
+            video_dir,
+            output_dir,
+            summary_path,
+            cookie_path=cookie_path,
+            print_output=print_output,
+            whisper_model=whisper_model,
+            summary_writer=summary_writer,
+            parallel_conversion=parallel_conversion,
+        )
+    finally:
+        cleanup_intermediate_dir(video_dir)
 
-        with yt_dlp.YoutubeDL(metadata_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-            channel = info.get("channel") or info.get("uploader")
-            if channel:
-                return channel
-    except Exception as exc:
-        logger.warning("Failed to extract channel from video %s: %s", video_url, exc)
 
+def get_video_info(video_url: str, *, cookie_path: pathlib.Path) -> Optional[Dict]:
+    """Extract metadata for a single video, or None if it cannot be fetched."""
+    try:
+        with new_youtube_dl(metadata_options(cookie_path)) as ydl:
+            return ydl.extract_info(video_url, download=False)
+    except Exception as exc:
+        logger.warning("Failed to extract metadata from video %s: %s", video_url, exc)
     return None
 
 
@@ -526,12 +1013,15 @@ def get_existing_video_ids(summary_path: pathlib.Path) -> set:
 
     existing_ids = set()
     try:
-        with summary_path.open("r", encoding="utf-8", newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                video_id = row.get("video_id")
+        # video_id is always the first column written by write_summary_row, and
+        # YouTube IDs never contain commas or quotes, so only that field is split
+        # off each raw line instead of parsing whole rows.
+        with summary_path.open("rb") as csvfile:
+            next(csvfile, None)
+            for line in csvfile:
+                video_id = line.split(b",", 1)[0].strip().strip(b'"')
                 if video_id:
-                    existing_ids.add(video_id)
+                    existing_ids.add(video_id.decode("ascii", "ignore"))
         logger.debug("Found %s existing video IDs in summary", len(existing_ids))
     except Exception as exc:
         logger.warning("Failed to read existing summary %s: %s", summary_path, exc)
@@ -576,6 +1066,19 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Process only the first N videos from channel (default: 0 = no limit).",
     )
+    parser.add_argument(
+        "--max-languages",
+        type=int,
+        default=1,
+        help="Number of subtitle languages to download per video, highest priority "
+        "first (default: 1).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of videos to process in parallel in channel mode (default: 4).",
+    )
     parser.add_argument(
         "--log-level",
         default=os.getenv("CHANNEL_DL_LOG_LEVEL", "INFO"),
@@ -593,6 +1096,18 @@ def parse_args() -> argparse.Namespace:
         "--urls-file",
         help="Path for the intermediate playlist file (defaults to <channel>-list.txt).",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=CHANNEL_CACHE_TTL_SECONDS,
+        help="Seconds a cached channel listing is reused before it is fetched again "
+        f"(default: {CHANNEL_CACHE_TTL_SECONDS}; 0 = always fetch).",
+    )
+    parser.add_argument(
+        "--refresh-listing",
+        action="store_true",
+        help="Fetch a fresh channel listing instead of using the cached one.",
+    )
     parser.add_argument(
         "--full",
         action="store_true",
@@ -622,6 +1137,12 @@ def main() -> None:
     args = parse_args()
     configure_logging(args.log_level)
 
+    # yt-dlp is imported lazily; check for it up front so a missing install
+    # fails here instead of as a retried download error for every video.
+    if importlib.util.find_spec("yt_dlp") is None:
+        logger.error("yt-dlp is not installed. Install with: pip install yt-dlp")
+        sys.exit(1)
+
     # Validate that -p/--print is only used with -v/--video
     if args.print_output and not args.video_url:
         logger.error("The -p/--print flag can only be used with -v/--video (single video mode).")
@@ -632,12 +1153,14 @@ def main() -> None:
     )
 
     whisper_model = None if args.no_whisper else args.whisper_model
+    max_languages = max(1, args.max_languages)
 
     # Single video mode
     if args.video_url:
         logger.info("Single video mode: %s", args.video_url)
 
         # Extract or use provided channel name
+        info = None
         if args.channel_name:
             try:
                 channel_slug = normalize_channel_name(args.channel_name)
@@ -647,7 +1170,10 @@ def main() -> None:
         else:
             # Try to extract channel from video metadata
             logger.info("Extracting channel name from video metadata...")
-            channel_name = get_channel_from_video(args.video_url, cookie_path=cookie_path)
+            # Kept and handed to process_single_video so the metadata is not
+            # fetched a second time.
+            info = get_video_info(args.video_url, cookie_path=cookie_path)
+            channel_name = info and (info.get("channel") or info.get("uploader"))
             if not channel_name:
                 logger.error("Could not determine channel name. Please provide -c/--channel.")
                 return
@@ -662,7 +1188,11 @@ def main() -> None:
         summary_path = output_dir / "subtitles_summary.csv"
 
         # Create a minimal entry dict for the single video
-        entry = {"url": args.video_url, "id": None, "title": None}
+        entry = {
+            "url": args.video_url,
+            "id": info.get("id") if info else None,
+            "title": info.get("title") if info else None,
+        }
 
         try:
             process_single_video(
@@ -672,6 +1202,8 @@ def main() -> None:
                 cookie_path=cookie_path,
                 print_output=args.print_output,
                 whisper_model=whisper_model,
+                max_languages=max_languages,
+                info=info,
             )
             if not args.print_output:
                 logger.info("Single video processing completed. Subtitle located in %s", output_dir / "final")
@@ -711,15 +1243,26 @@ def main() -> None:
     logger.info(
         "Starting YouTube channel subtitle downloader for @%s", channel_slug
     )
+    limit = args.limit if args.limit and args.limit > 0 else None
+    existing_ids = set() if args.full else get_existing_video_ids(summary_path)
+
+    # The limit can only be pushed down to the listing when nothing is filtered
+    # out afterwards; in incremental mode it applies to the new videos.
     logger.info("Fetching channel entries from %s", channel_url)
-    entries = get_channel_video_entries(channel_url, cookie_path=cookie_path)
+    entries = get_channel_video_entries(
+        channel_url,
+        cookie_path=cookie_path,
+        limit=None if existing_ids else limit,
+        cache_path=output_dir / ".cache" / "channel_entries.json",
+        refresh=args.full or args.refresh_listing,
+        cache_ttl=args.cache_ttl,
+    )
     if not entries:
         logger.error("No entries retrieved; exiting.")
         return
 
     # Incremental mode: filter out already processed videos
     if not args.full:
-        existing_ids = get_existing_video_ids(summary_path)
         if existing_ids:
             logger.info("Incremental mode: filtering already processed videos")
             entries = filter_new_videos(entries, existing_ids)
@@ -732,28 +1275,52 @@ def main() -> None:
             summary_path.unlink()
             logger.info("Existing summary file deleted")
 
-    limit = args.limit if args.limit and args.limit > 0 else None
     if limit:
         entries = entries[:limit]
         logger.info("Limiting processing to the first %s videos", limit)
 
     with open(urls_file, "w", encoding="utf-8") as fh:
-        for entry in entries:
-            fh.write(f"{entry['url']}\n")
+        fh.writelines(f"{entry['url']}\n" for entry in entries)
     logger.info("Saved %s video URLs to %s", len(entries), urls_file)
 
-    for idx, entry in enumerate(entries, start=1):
+    def _process(idx: int, entry: Dict) -> None:
         logger.info("[%s/%s] %s", idx, len(entries), entry.get("title") or entry["url"])
+        process_single_video(
+            entry,
+            output_dir,
+            summary_path,
+            cookie_path=cookie_path,
+            whisper_model=whisper_model,
+            summary_writer=summary_writer,
+            max_languages=max_languages,
+            parallel_conversion=True,
+            metadata_ydl=metadata_ydls.get(),
+            download_ydl=download_ydls.get(),
+        )
+
+    concurrency = max(1, args.concurrency)
+    # The VTT pool is listed first so it outlives the worker threads using it.
+    with vtt_pool_scope(), SummaryWriter(summary_path) as summary_writer, ThreadLocalYoutubeDL(
+        metadata_options(cookie_path)
+    ) as metadata_ydls, ThreadLocalYoutubeDL(
+        subtitle_download_options(cookie_path)
+    ) as download_ydls, ThreadPoolExecutor(max_workers=concurrency) as executor:
         try:
-            process_single_video(
-                entry,
-                output_dir,
-                summary_path,
-                cookie_path=cookie_path,
-                whisper_model=whisper_model,
-            )
-        except Exception as exc:
-            logger.error("Failed to process %s: %s", entry["url"], exc)
+            futures = {
+                executor.submit(_process, idx, entry): entry
+                for idx, entry in enumerate(entries, start=1)
+            }
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.error("Failed to process %s: %s", entry["url"], exc)
+        except BaseException:
+            # On Ctrl-C, drop the queued videos instead of letting the
+            # executor's exit wait for all of them to run.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     logger.info("All tasks completed. Subtitles located in %s", output_dir / "final")
 
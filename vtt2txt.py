@@ -1,44 +1,90 @@
 # vtt2txt.py
-import re, sys, pathlib, html
+import re, sys, os, pathlib, html
+from concurrent.futures import ProcessPoolExecutor
 
 # Drop headers/notes and cue timing lines
 RX_META = re.compile(r'^(WEBVTT|Kind:|Language:|STYLE|NOTE|REGION|Region:)', re.IGNORECASE)
 RX_TIMING = re.compile(r'-->\s')  # lines containing cue timestamps
+# First characters RX_META can match (IGNORECASE also folds the Kelvin sign and long s)
+META_FIRST_CHARS = frozenset("WwKkLlSsNnRr\u212a\u017f")
 
 # Clean inline junk
 RX_INLINE_TS = re.compile(r'<\d{2}:\d{2}:\d{2}\.\d{3}>')  # <00:00:00.000>
 RX_TAGS = re.compile(r'</?[^>]+>')                        # <c>, </c>, <i>, etc.
-RX_WS = re.compile(r'\s+')                                # any whitespace -> single space
 
-def normalize(line: str) -> str:
-    line = RX_INLINE_TS.sub("", line)
-    line = RX_TAGS.sub("", line)
-    line = html.unescape(line)
-    line = RX_WS.sub(" ", line).strip()                   # remove the spaces (normalize to single)
-    return line
+# Defaults bind the regex methods once, so each call uses fast local lookups
+def normalize(line: str, _strip_ts=RX_INLINE_TS.sub, _strip_tags=RX_TAGS.sub,
+              _unescape=html.unescape) -> str:
+    # Most cue lines carry no markup or entities; skip those passes for them.
+    if "<" in line:
+        line = _strip_ts("", line)
+        line = _strip_tags("", line)
+    if "&" in line:
+        line = _unescape(line)
+    return " ".join(line.split())                         # any whitespace -> single space, trimmed
 
 def process(path: pathlib.Path):
     seen = set()
-    out_lines = []
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
+    # A raw line met before was already written or found empty; rolling
+    # auto-captions repeat most lines, so those skip normalize() entirely.
+    seen_raw = set()
+    match_meta, search_timing, meta_first = RX_META.match, RX_TIMING.search, META_FIRST_CHARS
+    # Lines are written as they are found instead of being joined at the end.
+    with path.open("r", encoding="utf-8", errors="ignore") as f, \
+            path.with_suffix(".txt").open("w", encoding="utf-8", buffering=1 << 16) as out:
         for raw in f:
-            if RX_META.match(raw) or RX_TIMING.search(raw):
+            if raw in seen_raw:
+                continue
+            seen_raw.add(raw)
+            # Plain-string prechecks first; cue text rarely needs either regex.
+            if raw[:1] in meta_first and match_meta(raw):
+                continue
+            if "-->" in raw and search_timing(raw):
                 continue
             text = normalize(raw)
             if not text:
                 continue
             if text not in seen:                          # de-duplicate lines globally
                 seen.add(text)
-                out_lines.append(text)
-    path.with_suffix(".txt").write_text("\n".join(out_lines) + "\n", encoding="utf-8")
+                out.write(text)
+                out.write("\n")
+        if not seen:
+            out.write("\n")                               # empty transcript: a lone newline, as before
+
+def _walk_vtt(root):
+    # scandir reuses cached d_type and only builds a Path for actual .vtt files
+    root = os.fspath(root)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except PermissionError:
+            if directory == root:
+                raise
+            continue                                      # like rglob, skip unreadable subdirectories
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".vtt"):
+                    yield pathlib.Path(entry.path)
 
 if __name__ == "__main__":
     targets = [pathlib.Path(p) for p in (sys.argv[1:] or [])]
     if not targets:
         sys.exit("Usage: python vtt2txt.py file1.vtt [file2.vtt ...] | DIRS")
+    files = []
     for p in targets:
         if p.is_dir():
-            for v in p.rglob("*.vtt"):
-                process(v)
+            files.extend(_walk_vtt(p))
         elif p.suffix.lower() == ".vtt":
-            process(p)
+            files.append(p)
+    if len(files) < 2:
+        for v in files:
+            process(v)
+    else:
+        # Files are independent and parsing is CPU-bound: one per core
+        workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(process, files, chunksize=max(1, min(8, len(files) // (workers * 4)))))